@@ -36,42 +36,42 @@ def run_command(cmd, cwd=None, timeout=30):
         log_message(f"Command failed: {cmd} - {e}", "ERROR")
         return None
 
+LINTABLE_EXTENSIONS = frozenset({'.js', '.jsx', '.ts', '.tsx', '.mjs', '.cjs', '.mts', '.cts'})
+
+# Based on dprint.json includes pattern
+FORMATTABLE_EXTENSIONS = frozenset({
+    '.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs', '.mts', '.cts',
+    '.json', '.jsonc', '.md', '.toml', '.yaml', '.yml',
+    '.css', '.scss', '.sass', '.less'
+})
+
 def is_lintable_file(file_path):
     """Check if file should be linted with oxlint"""
-    extensions = {'.js', '.jsx', '.ts', '.tsx', '.mjs', '.cjs', '.mts', '.cts'}
-    return Path(file_path).suffix.lower() in extensions
+    return Path(file_path).suffix.lower() in LINTABLE_EXTENSIONS
 
 def is_formattable_file(file_path):
     """Check if file should be formatted with dprint"""
-    # Based on dprint.json includes pattern
-    extensions = {
-        '.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs', '.mts', '.cts',
-        '.json', '.jsonc', '.md', '.toml', '.yaml', '.yml',
-        '.css', '.scss', '.sass', '.less'
-    }
-    return Path(file_path).suffix.lower() in extensions or Path(file_path).name == 'Dockerfile'
+    path = Path(file_path)
+    return path.suffix.lower() in FORMATTABLE_EXTENSIONS or path.name == 'Dockerfile'
+
+# Excluded directories/patterns based on dprint.json, matched in a single pass
+EXCLUDE_PATTERN = re.compile('|'.join(re.escape(pattern) for pattern in (
+    '/.git/', '/.trunk/', '/.turbo/', '/.next/', '/node_modules/',
+    '/dist/', '/build/', '/coverage/', '/playwright-report/',
+    '/.vercel/', '/.claude/', '/.github/', '/.vscode/', '/.idea/',
+    '/.trae/', '/.ruler/', '/test-results/', '/archon/', '/serena/',
+    '/logs/', '/.env', '/sentry.', '/instrumentation', '/.tmp/',
+    # Generated files
+    '.generated.',
+)))
 
 def should_process_file(file_path):
     """Check if file should be processed (not in excludes)"""
     file_path = Path(file_path).as_posix()
-    
-    # Skip if in excluded directories/patterns based on dprint.json
-    exclude_patterns = [
-        '/.git/', '/.trunk/', '/.turbo/', '/.next/', '/node_modules/',
-        '/dist/', '/build/', '/coverage/', '/playwright-report/',
-        '/.vercel/', '/.claude/', '/.github/', '/.vscode/', '/.idea/',
-        '/.trae/', '/.ruler/', '/test-results/', '/archon/', '/serena/',
-        '/logs/', '/.env', '/sentry.', '/instrumentation', '/.tmp/'
-    ]
-    
-    for pattern in exclude_patterns:
-        if pattern in file_path:
-            return False
-    
-    # Skip generated files
-    if '.generated.' in file_path or file_path.endswith('.d.ts'):
+
+    if EXCLUDE_PATTERN.search(file_path) or file_path.endswith('.d.ts'):
         return False
-        
+
     return True
 
 def run_oxlint(file_path, project_root):
@@ -0,0 +1,73 @@
+import { describe, it, expect, vi, afterEach } from 'vitest'
+import type { SupabaseClient } from '@supabase/supabase-js'
+import type { Database } from '@neonpro/database'
+import { getAuditLogMetrics, logAuditEventInBackground, type LogAuditEventOptions } from '../utils/audit-log'
+import { drainBackgroundTasks } from '../utils/background-tasks'
+
+const createMockClient = () => {
+  const insert = vi.fn().mockResolvedValue({ error: null })
+  const client = { from: vi.fn(() => ({ insert })) } as unknown as SupabaseClient<Database>
+  return { client, insert }
+}
+
+const createEvent = (supabase: SupabaseClient<Database>, userId: string): LogAuditEventOptions => ({
+  supabase,
+  clinicId: 'clinic-1',
+  userId,
+  action: 'API_ACCESS',
+  resourceType: 'TRPC_API',
+})
+
+describe('Audit log background writes', () => {
+  afterEach(async () => {
+    await drainBackgroundTasks()
+    vi.restoreAllMocks()
+  })
+
+  it('should insert the row through the caller client', async () => {
+    const { client, insert } = createMockClient()
+
+    logAuditEventInBackground(createEvent(client, 'user-1'))
+    await drainBackgroundTasks()
+
+    expect(client.from).toHaveBeenCalledWith('audit_logs')
+    expect(insert).toHaveBeenCalledWith(expect.objectContaining({ clinic_id: 'clinic-1', user_id: 'user-1' }))
+  })
+
+  it('should log a failed insert instead of throwing', async () => {
+    const errorSpy = vi.spyOn(console, 'error').mockImplementation(() => {})
+    const { client, insert } = createMockClient()
+    insert.mockRejectedValueOnce(new Error('network down'))
+
+    expect(() => logAuditEventInBackground(createEvent(client, 'user-1'))).not.toThrow()
+    await drainBackgroundTasks()
+
+    expect(errorSpy).toHaveBeenCalledWith('Background task failed (audit log write):', expect.any(Error))
+  })
+
+  it('should drop events past the in-flight limit and report them', async () => {
+    const warnSpy = vi.spyOn(console, 'warn').mockImplementation(() => {})
+    const { client, insert } = createMockClient()
+    let releaseInserts!: () => void
+    const blocked = new Promise<{ error: null }>((resolve) => {
+      releaseInserts = () => resolve({ error: null })
+    })
+    insert.mockReturnValue(blocked)
+    const droppedBefore = getAuditLogMetrics().dropped
+
+    const accepted = Array.from({ length: 1001 }, () => logAuditEventInBackground(createEvent(client, 'user-1')))
+
+    expect(accepted.filter(Boolean)).toHaveLength(1000)
+    expect(accepted[1000]).toBe(false)
+    expect(getAuditLogMetrics()).toEqual({ inFlight: 1000, dropped: droppedBefore + 1 })
+    expect(JSON.parse(warnSpy.mock.calls[0]![0] as string)).toMatchObject({
+      event: 'audit_log_dropped',
+      reason: 'in_flight_limit',
+      clinicId: 'clinic-1',
+    })
+
+    releaseInserts()
+    await drainBackgroundTasks()
+    expect(getAuditLogMetrics().inFlight).toBe(0)
+  })
+})
@@ -0,0 +1,35 @@
+import { describe, it, expect, vi, afterEach } from 'vitest'
+import { drainBackgroundTasks, runInBackground } from '../utils/background-tasks'
+
+const VERCEL_REQUEST_CONTEXT = Symbol.for('@vercel/request-context')
+
+describe('Background tasks', () => {
+  afterEach(async () => {
+    await drainBackgroundTasks()
+    delete (globalThis as Record<symbol, unknown>)[VERCEL_REQUEST_CONTEXT]
+    vi.restoreAllMocks()
+  })
+
+  it('should hand the task to the Vercel request context waitUntil when present', () => {
+    const waitUntil = vi.fn()
+    ;(globalThis as Record<symbol, unknown>)[VERCEL_REQUEST_CONTEXT] = { get: () => ({ waitUntil }) }
+
+    const tracked = runInBackground('test task', Promise.resolve())
+
+    expect(waitUntil).toHaveBeenCalledWith(tracked)
+  })
+
+  it('should let drainBackgroundTasks wait for pending tasks', async () => {
+    let resolveTask!: () => void
+    let settled = false
+    runInBackground('test task', new Promise<void>((resolve) => { resolveTask = resolve })).then(() => {
+      settled = true
+    })
+
+    const drained = drainBackgroundTasks()
+    resolveTask()
+    await drained
+
+    expect(settled).toBe(true)
+  })
+})
@@ -0,0 +1,112 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest'
+import jwt from 'jsonwebtoken'
+import { JWTService } from '../services/jwt-service'
+
+describe('JWTService validation cache', () => {
+  beforeEach(() => {
+    process.env['JWT_SECRET'] = 'test-secret'
+    vi.useFakeTimers()
+    vi.setSystemTime(new Date('2026-01-01T00:00:00Z'))
+  })
+
+  afterEach(() => {
+    vi.useRealTimers()
+    vi.restoreAllMocks()
+  })
+
+  const createToken = (service: JWTService, userId: string, expiresIn = '1h') =>
+    service.generateToken({ userId, sessionId: `session-${userId}`, role: 'patient' }, expiresIn)
+
+  it('should skip signature verification on a cache hit', async () => {
+    const service = new JWTService()
+    const token = createToken(service, 'user-1')
+    const verifySpy = vi.spyOn(jwt, 'verify')
+
+    const first = await service.validateToken(token)
+    const second = await service.validateToken(token)
+
+    expect(first.isValid).toBe(true)
+    expect(second).toEqual(first)
+    expect(verifySpy).toHaveBeenCalledTimes(1)
+  })
+
+  it('should return a copy of the cached payload', async () => {
+    const service = new JWTService()
+    const token = createToken(service, 'user-1')
+
+    const first = await service.validateToken(token)
+    first.payload!.role = 'admin'
+    const second = await service.validateToken(token)
+
+    expect(second.payload?.role).toBe('patient')
+  })
+
+  it('should re-verify once the cache TTL has elapsed', async () => {
+    const service = new JWTService({ cacheTtlMs: 1000 })
+    const token = createToken(service, 'user-1')
+    const verifySpy = vi.spyOn(jwt, 'verify')
+
+    await service.validateToken(token)
+    vi.advanceTimersByTime(1001)
+    const result = await service.validateToken(token)
+
+    expect(result.isValid).toBe(true)
+    expect(verifySpy).toHaveBeenCalledTimes(2)
+  })
+
+  it('should reject a cached token once its exp has passed', async () => {
+    const service = new JWTService()
+    const token = createToken(service, 'user-1', '2s')
+
+    expect((await service.validateToken(token)).isValid).toBe(true)
+
+    vi.advanceTimersByTime(3000)
+    const result = await service.validateToken(token)
+
+    expect(result.isValid).toBe(false)
+  })
+
+  it('should treat a cached token as expired from the second of its exp claim', async () => {
+    const service = new JWTService()
+    const token = createToken(service, 'user-1', '2s')
+    const verifySpy = vi.spyOn(jwt, 'verify')
+
+    expect((await service.validateToken(token)).isValid).toBe(true)
+
+    vi.advanceTimersByTime(2000)
+    const result = await service.validateToken(token)
+
+    // The cache entry is dropped, and uncached verification rejects it at the same boundary
+    expect(result.isValid).toBe(false)
+    expect(verifySpy).toHaveBeenCalledTimes(2)
+  })
+
+  it('should evict the oldest entry when the cache is full', async () => {
+    const service = new JWTService({ cacheMaxEntries: 2 })
+    const [tokenA, tokenB, tokenC] = ['user-a', 'user-b', 'user-c'].map((userId) => createToken(service, userId))
+    const verifySpy = vi.spyOn(jwt, 'verify')
+
+    await service.validateToken(tokenA!)
+    await service.validateToken(tokenB!)
+    await service.validateToken(tokenC!)
+    expect(verifySpy).toHaveBeenCalledTimes(3)
+
+    // tokenA was evicted, tokenC is still cached
+    await service.validateToken(tokenA!)
+    expect(verifySpy).toHaveBeenCalledTimes(4)
+    await service.validateToken(tokenC!)
+    expect(verifySpy).toHaveBeenCalledTimes(4)
+  })
+
+  it('should not share cached results between instances with different secrets', async () => {
+    const issuer = new JWTService()
+    const token = createToken(issuer, 'user-1')
+    expect((await issuer.validateToken(token)).isValid).toBe(true)
+
+    process.env['JWT_SECRET'] = 'rotated-secret'
+    const rotated = new JWTService()
+    const result = await rotated.validateToken(token)
+
+    expect(result.isValid).toBe(false)
+  })
+})
@@ -0,0 +1,26 @@
+import { describe, it, expect, vi, afterEach } from 'vitest'
+import { SessionService } from '../services/session-service'
+import { drainBackgroundTasks } from '../utils/background-tasks'
+
+describe('SessionService access-time update', () => {
+  afterEach(async () => {
+    await drainBackgroundTasks()
+    vi.restoreAllMocks()
+  })
+
+  it('should log a rejected access-time update without failing getSession', async () => {
+    const errorSpy = vi.spyOn(console, 'error').mockImplementation(() => {})
+    const failure = new Error('write failed')
+    vi.spyOn(
+      SessionService.prototype as unknown as { updateSessionAccess: (sessionId: string) => Promise<void> },
+      'updateSessionAccess',
+    ).mockRejectedValue(failure)
+
+    const result = await new SessionService().getSession('test-session-id')
+    await drainBackgroundTasks()
+
+    expect(result.session?.id).toBe('test-session-id')
+    expect(result.metadata.validationDetails.isValid).toBe(true)
+    expect(errorSpy).toHaveBeenCalledWith('Background task failed (session access update):', failure)
+  })
+})
@@ -0,0 +1,36 @@
+import { describe, it, expect, vi, afterEach } from 'vitest'
+import { complianceProcedure, createTRPCRouter, type Context } from '../../trpc'
+import { drainBackgroundTasks } from '../../utils/background-tasks'
+
+const router = createTRPCRouter({
+  ping: complianceProcedure.query(() => 'pong'),
+})
+
+describe('healthcareComplianceMiddleware', () => {
+  afterEach(async () => {
+    await drainBackgroundTasks()
+    vi.restoreAllMocks()
+  })
+
+  it('should answer before the audit insert settles and write it under the caller client', async () => {
+    let resolveInsert!: (value: { error: null }) => void
+    const insert = vi.fn(() => new Promise((resolve) => { resolveInsert = resolve }))
+    const supabase = { from: vi.fn(() => ({ insert })) }
+    const caller = router.createCaller({
+      supabase,
+      user: { id: 'user-1' },
+      clinicId: 'clinic-1',
+      environment: 'development',
+    } as unknown as Context)
+
+    await expect(caller.ping()).resolves.toBe('pong')
+
+    expect(supabase.from).toHaveBeenCalledWith('audit_logs')
+    expect(insert).toHaveBeenCalledWith(
+      expect.objectContaining({ clinic_id: 'clinic-1', user_id: 'user-1', action: 'API_ACCESS' }),
+    )
+
+    resolveInsert({ error: null })
+    await drainBackgroundTasks()
+  })
+})
@@ -0,0 +1,93 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest'
+
+const { mockGetUser } = vi.hoisted(() => {
+  process.env['SUPABASE_URL'] = 'https://test.supabase.co'
+  process.env['SUPABASE_ANON_KEY'] = 'test-anon-key'
+  return { mockGetUser: vi.fn() }
+})
+
+vi.mock('@supabase/supabase-js', () => ({
+  createClient: vi.fn(() => ({ auth: { getUser: mockGetUser } })),
+  SupabaseClient: vi.fn(function () {
+    return { auth: { getUser: mockGetUser } }
+  }),
+}))
+
+import type { CreateHTTPContextOptions } from '@trpc/server/adapters/standalone'
+import { createContext } from '../../trpc/context'
+import { createTRPCContext } from '../../trpc'
+
+const NOW = new Date('2026-01-01T00:00:00Z').getTime()
+
+const createAuthHeader = (sub: string, expiresInSeconds: number) => {
+  const payload = Buffer.from(JSON.stringify({ sub, exp: Math.floor(NOW / 1000) + expiresInSeconds }))
+  return `Bearer header.${payload.toString('base64url')}.signature`
+}
+
+const createRequest = (authHeader: string) =>
+  new Request('https://api.neonpro.test/trpc', { headers: { authorization: authHeader } })
+
+describe('tRPC context - user cache', () => {
+  beforeEach(() => {
+    vi.useFakeTimers()
+    vi.setSystemTime(NOW)
+    mockGetUser.mockReset()
+  })
+
+  afterEach(() => {
+    vi.useRealTimers()
+  })
+
+  it('should skip getUser for a repeated Authorization header', async () => {
+    const authHeader = createAuthHeader('user-cached', 3600)
+    mockGetUser.mockResolvedValue({ data: { user: { id: 'user-cached', user_metadata: {} } }, error: null })
+
+    const first = await createContext({ req: createRequest(authHeader) })
+    const second = await createContext({ req: createRequest(authHeader) })
+
+    expect(mockGetUser).toHaveBeenCalledTimes(1)
+    expect(second.session).toEqual(first.session)
+    expect(second.session).not.toBe(first.session)
+  })
+
+  it('should not serve a cached user once the token has expired', async () => {
+    const authHeader = createAuthHeader('user-expiring', 30)
+    mockGetUser
+      .mockResolvedValueOnce({ data: { user: { id: 'user-expiring', user_metadata: {} } }, error: null })
+      .mockResolvedValueOnce({ data: { user: null }, error: { message: 'JWT expired' } })
+
+    await createContext({ req: createRequest(authHeader) })
+    vi.advanceTimersByTime(31_000)
+    const context = await createContext({ req: createRequest(authHeader) })
+
+    expect(mockGetUser).toHaveBeenCalledTimes(2)
+    expect(context.session).toBeNull()
+  })
+
+  it('should not cache a token without a readable exp claim', async () => {
+    const authHeader = 'Bearer opaque-token'
+    mockGetUser.mockResolvedValue({ data: { user: { id: 'user-opaque', user_metadata: {} } }, error: null })
+
+    await createContext({ req: createRequest(authHeader) })
+    await createContext({ req: createRequest(authHeader) })
+
+    expect(mockGetUser).toHaveBeenCalledTimes(2)
+  })
+
+  it('should share cached users between the edge and HTTP context factories', async () => {
+    const authHeader = createAuthHeader('user-shared', 3600)
+    mockGetUser.mockResolvedValue({
+      data: { user: { id: 'user-shared', user_metadata: { clinic_id: 'clinic-1' } } },
+      error: null,
+    })
+
+    await createContext({ req: createRequest(authHeader) })
+    const httpContext = await createTRPCContext({
+      req: { headers: { authorization: authHeader } },
+    } as unknown as CreateHTTPContextOptions)
+
+    expect(mockGetUser).toHaveBeenCalledTimes(1)
+    expect(httpContext.user?.id).toBe('user-shared')
+    expect(httpContext.clinicId).toBe('clinic-1')
+  })
+})
@@ -8,4 +8,11 @@ export const prisma =
 
 if (process.env.NODE_ENV !== 'production') globalForPrisma.prisma = prisma;
 
+// Open the connection pool eagerly so the first request does not pay for the handshake
+if (process.env.NODE_ENV !== 'test') {
+  prisma.$connect().catch((error) => {
+    console.error('Failed to warm Prisma connection pool:', error);
+  });
+}
+
 export default prisma;
@@ -130,6 +130,6 @@ export function healthcareRLS<T = any>(
   table: string,
   userToken?: string,
 ): RLSQueryBuilder<T> {
-  const client = userToken ? createUserClient(userToken) : createServerClient();
+  const client = userToken ? createUserClient(userToken) : supabaseClient;
   return new RLSQueryBuilder<T>(client, table);
 }
@@ -11,6 +11,7 @@ import { logger } from 'hono/logger'
 import { appRouter } from './trpc/router'
 import { createContext } from './trpc/context'
 import { fetchRequestHandler } from '@trpc/server/adapters/fetch'
+import { getAuditLogMetrics } from './utils/audit-log'
 
 // Create Hono app
 const app = new Hono()
@@ -33,7 +34,8 @@ app.get('/health', (c) => {
     status: 'healthy',
     timestamp: new Date().toISOString(),
     version: '1.0.0',
-    uptime: process.uptime()
+    uptime: process.uptime(),
+    auditLog: getAuditLogMetrics()
   })
 })
 
@@ -1,3 +1,4 @@
+import { createHash } from 'crypto'
 import jwt from 'jsonwebtoken'
 
 export interface JWTPayload {
@@ -16,12 +17,45 @@ export interface JWTValidationResult {
   error?: string
 }
 
+interface CachedValidation {
+  payload: JWTPayload
+  cachedAt: number
+}
+
+export interface JWTServiceOptions {
+  cacheTtlMs?: number
+  cacheMaxEntries?: number
+}
+
+// Short-lived cache of verified payloads so hot paths skip repeated signature checks
+const VALIDATION_CACHE_TTL_MS = 30_000
+const VALIDATION_CACHE_MAX_ENTRIES = 10_000
+
+// Tokens are never stored in plain text, only a truncated SHA-256 digest
+const getTokenCacheKey = (token: string): string =>
+  createHash('sha256').update(token).digest('hex').slice(0, 32)
+
+// Same boundary as jsonwebtoken: a token is expired from the second of its exp claim
+const isExpired = (exp: number, nowMs: number = Date.now()): boolean =>
+  exp <= Math.floor(nowMs / 1000)
+
+/**
+ * Verifies HS256 tokens and caches successful results per instance.
+ * A cached token is not re-checked against session revocation, so a revoked
+ * token can keep validating for up to the cache TTL (30s by default).
+ */
 export class JWTService {
   private secret: string
   private algorithm: jwt.Algorithm = 'HS256'
+  // Scoped to the instance so a cached result is only trusted under the secret that verified it
+  private validationCache = new Map<string, CachedValidation>()
+  private cacheTtlMs: number
+  private cacheMaxEntries: number
 
-  constructor() {
+  constructor(options: JWTServiceOptions = {}) {
     this.secret = process.env['JWT_SECRET'] || 'default-secret-key-change-in-production'
+    this.cacheTtlMs = options.cacheTtlMs ?? VALIDATION_CACHE_TTL_MS
+    this.cacheMaxEntries = options.cacheMaxEntries ?? VALIDATION_CACHE_MAX_ENTRIES
   }
 
   async validateToken(token: string): Promise<JWTValidationResult> {
@@ -33,6 +67,15 @@ export class JWTService {
         }
       }
 
+      const cacheKey = getTokenCacheKey(token)
+      const cached = this.getCachedPayload(cacheKey)
+      if (cached) {
+        return {
+          isValid: true,
+          payload: cached
+        }
+      }
+
       const decoded = jwt.verify(token, this.secret, {
         algorithms: [this.algorithm],
         complete: false
@@ -56,7 +99,7 @@ export class JWTService {
       }
 
       // Check expiration
-      if (payload.exp && payload.exp < Math.floor(Date.now() / 1000)) {
+      if (payload.exp && isExpired(payload.exp)) {
         return {
           isValid: false,
           error: 'Token has expired'
@@ -82,6 +125,8 @@ export class JWTService {
         validatedPayload.reason = payload.reason
       }
 
+      this.cachePayload(cacheKey, validatedPayload)
+
       return {
         isValid: true,
         payload: validatedPayload
@@ -112,6 +157,35 @@ export class JWTService {
     return jwt.sign(tokenPayload, this.secret, { algorithm: this.algorithm })
   }
 
+  private getCachedPayload(cacheKey: string): JWTPayload | null {
+    const cached = this.validationCache.get(cacheKey)
+    if (!cached) {
+      return null
+    }
+
+    // Drop entries past the TTL or whose token has expired since it was cached
+    const now = Date.now()
+    if (now - cached.cachedAt > this.cacheTtlMs || (cached.payload.exp && isExpired(cached.payload.exp, now))) {
+      this.validationCache.delete(cacheKey)
+      return null
+    }
+
+    // Hand out a copy so callers cannot mutate the cached entry
+    return { ...cached.payload }
+  }
+
+  private cachePayload(cacheKey: string, payload: JWTPayload): void {
+    if (this.validationCache.size >= this.cacheMaxEntries) {
+      // Map preserves insertion order, so the first key is the oldest entry
+      const oldestKey = this.validationCache.keys().next().value
+      if (oldestKey !== undefined) {
+        this.validationCache.delete(oldestKey)
+      }
+    }
+
+    this.validationCache.set(cacheKey, { payload: { ...payload }, cachedAt: Date.now() })
+  }
+
   private parseExpiration(expiresIn: string): number {
     const unit = expiresIn.slice(-1)
     const value = parseInt(expiresIn.slice(0, -1))
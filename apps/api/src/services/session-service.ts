@@ -1,3 +1,5 @@
+import { runInBackground } from '../utils/background-tasks'
+
 export interface HealthcareSession {
   id: string
   userId: string
@@ -106,8 +108,8 @@ export class SessionService {
         }
       }
 
-      // Update last accessed time
-      await this.updateSessionAccess(sessionId)
+      // Update last accessed time without holding the request on the write
+      runInBackground('session access update', this.updateSessionAccess(sessionId))
 
       return {
         session,
@@ -5,7 +5,7 @@
  * Following docs/rules/supabase-best-practices.md
  */
 
-import { createAdminClient, createServerClient } from '../lib/supabase/client';
+import { createAdminClient, supabaseAdmin, supabaseClient } from '../lib/supabase/client';
 
 export interface HealthCheckResult {
   status: 'healthy' | 'unhealthy' | 'degraded';
@@ -22,7 +22,7 @@ export async function checkSupabaseHealth(): Promise<HealthCheckResult> {
 
   try {
     // Test 1: Basic connection with server client
-    const serverClient = createServerClient();
+    const serverClient = supabaseClient;
     const { data: _serverTest, error: serverError } = await serverClient
       .from('profiles')
       .select('count')
@@ -38,7 +38,7 @@ export async function checkSupabaseHealth(): Promise<HealthCheckResult> {
     }
 
     // Test 2: Admin client connection
-    const adminClient = createAdminClient();
+    const adminClient = supabaseAdmin ?? createAdminClient();
     const { data: _adminTest, error: adminError } = await adminClient
       .from('audit_logs')
       .select('count')
@@ -93,7 +93,7 @@ export async function checkRLSPolicies(): Promise<HealthCheckResult> {
   const timestamp = new Date().toISOString();
 
   try {
-    const serverClient = createServerClient();
+    const serverClient = supabaseClient;
 
     // Test RLS by trying to access patients without auth (should fail)
     const { data, error } = await serverClient
@@ -146,7 +146,7 @@ export async function checkLGPDCompliance(): Promise<HealthCheckResult> {
   const timestamp = new Date().toISOString();
 
   try {
-    const adminClient = createAdminClient();
+    const adminClient = supabaseAdmin ?? createAdminClient();
 
     // Check if consent_records table exists and is accessible
     const { error } = await adminClient
@@ -9,20 +9,14 @@ import { type CreateHTTPContextOptions } from '@trpc/server/adapters/standalone'
 import { type CreateWSSContextFnOptions } from '@trpc/server/adapters/ws'
 import { SupabaseClient } from '@supabase/supabase-js'
 import { Database } from '@neonpro/database'
-import { logAuditEvent } from './utils/audit-log'
+import { logAuditEventInBackground } from './utils/audit-log'
+import { resolveUser } from './trpc/user-cache'
 
 /**
- * This is the actual context you'll use in your router
- * @link https://trpc.io/docs/context
+ * Build the shared context for a bearer token.
+ * Creates one Supabase client and resolves the user once per request.
  */
-export const createTRPCContext = async (opts: CreateHTTPContextOptions) => {
-  const { req } = opts
-
-  // Get the token from the Authorization header
-  const rawAuthHeader = req.headers['authorization']
-  const bearerHeader = Array.isArray(rawAuthHeader) ? rawAuthHeader[0] : rawAuthHeader
-  const token = bearerHeader?.startsWith('Bearer ') ? bearerHeader.replace('Bearer ', '') : bearerHeader
-
+const createContextForToken = async (token: string | undefined) => {
   // Create Supabase client
   const supabase = new SupabaseClient<Database>(
     process.env['SUPABASE_URL'] ?? '',
@@ -36,8 +30,8 @@ export const createTRPCContext = async (opts: CreateHTTPContextOptions) => {
     }
   )
 
-  // Get the user from the token
-  const { data: { user } } = await supabase.auth.getUser(token)
+  // Get the user from the token through the shared cache (skipped entirely for anonymous requests)
+  const user = token ? await resolveUser(supabase, token) : null
 
   // Get the clinic ID from user metadata
   const userMetadata = user?.user_metadata as Record<string, unknown> | undefined
@@ -52,6 +46,21 @@ export const createTRPCContext = async (opts: CreateHTTPContextOptions) => {
   }
 }
 
+/**
+ * This is the actual context you'll use in your router
+ * @link https://trpc.io/docs/context
+ */
+export const createTRPCContext = async (opts: CreateHTTPContextOptions) => {
+  const { req } = opts
+
+  // Get the token from the Authorization header
+  const rawAuthHeader = req.headers['authorization']
+  const bearerHeader = Array.isArray(rawAuthHeader) ? rawAuthHeader[0] : rawAuthHeader
+  const token = bearerHeader?.startsWith('Bearer ') ? bearerHeader.replace('Bearer ', '') : bearerHeader
+
+  return createContextForToken(token)
+}
+
 /**
  * This is the context used in WebSocket connections
  * @link https://trpc.io/docs/adapters/ws
@@ -62,33 +71,7 @@ export const createWSSContext = async (opts: CreateWSSContextFnOptions) => {
   // Get the token from the query string
   const token = req.url?.split('token=')[1]
 
-  // Create Supabase client
-  const supabase = new SupabaseClient<Database>(
-    process.env['SUPABASE_URL'] ?? '',
-    process.env['SUPABASE_ANON_KEY'] ?? '',
-    {
-      global: {
-        headers: {
-          Authorization: token ? `Bearer ${token}` : '',
-        },
-      },
-    }
-  )
-
-  // Get the user from the token
-  const { data: { user } } = await supabase.auth.getUser(token)
-
-  // Get the clinic ID from user metadata
-  const userMetadata = user?.user_metadata as Record<string, unknown> | undefined
-  const clinicId = typeof userMetadata?.['clinic_id'] === 'string' ? userMetadata['clinic_id'] : undefined
-
-  return {
-    supabase,
-    user,
-    clinicId: clinicId ?? '',
-    environment: process.env['NODE_ENV'] === 'production' ? 'production' :
-                 process.env['NODE_ENV'] === 'staging' ? 'staging' : 'development',
-  }
+  return createContextForToken(token)
 }
 
 /**
@@ -180,8 +163,8 @@ export const protectedProcedure = t.procedure.use(({ ctx, next }) => {
  * @link https://trpc.io/docs/middlewares
  */
 export const healthcareComplianceMiddleware = t.middleware(async ({ ctx, next }) => {
-  // Log access for compliance
-  await logAuditEvent({
+  // Log access for compliance under the caller's RLS context, without holding the response
+  logAuditEventInBackground({
     supabase: ctx.supabase,
     clinicId: ctx.clinicId,
     userId: ctx.user?.id ?? null,
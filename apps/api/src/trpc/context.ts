@@ -1,6 +1,7 @@
 import { createClient } from '@supabase/supabase-js'
 import type { inferAsyncReturnType } from '@trpc/server'
 import type { Database } from '@neonpro/types'
+import { resolveUser } from './user-cache'
 
 const supabaseUrl = process.env['SUPABASE_URL']
 const supabaseAnonKey = process.env['SUPABASE_ANON_KEY']
@@ -19,13 +20,18 @@ export const createContext = async ({ req }: { req: Request }) => {
     },
   })
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser()
+  if (!authHeader) {
+    return {
+      supabase,
+      session: null,
+    }
+  }
+
+  const session = await resolveUser(supabase, authHeader.replace(/^Bearer\s+/i, ''))
 
   return {
     supabase,
-    session: user,
+    session,
   }
 }
 
@@ -0,0 +1,90 @@
+/**
+ * Cached token-to-user resolution shared by every tRPC context factory
+ */
+
+import type { SupabaseClient, User } from '@supabase/supabase-js'
+
+// Resolved users are reused briefly so authenticated requests skip the Auth round trip
+const USER_CACHE_TTL_MS = 60_000
+const USER_CACHE_MAX_ENTRIES = 10_000
+const userCache = new Map<string, { user: User; expiresAt: number }>()
+
+// Web Crypto keeps this usable on the Edge runtime; raw tokens are never stored
+const getTokenCacheKey = async (token: string): Promise<string> => {
+  const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(token))
+  return Array.from(new Uint8Array(digest).slice(0, 16), (byte) => byte.toString(16).padStart(2, '0')).join('')
+}
+
+// Reads the exp claim (in ms) of a token that Supabase Auth has already accepted
+const getTokenExpiry = (token: string): number | null => {
+  const payloadSegment = token.split('.')[1]
+  if (!payloadSegment) {
+    return null
+  }
+
+  try {
+    const base64 = payloadSegment.replace(/-/g, '+').replace(/_/g, '/')
+    const payload = JSON.parse(atob(base64.padEnd(Math.ceil(base64.length / 4) * 4, '='))) as { exp?: unknown }
+    return typeof payload.exp === 'number' ? payload.exp * 1000 : null
+  } catch {
+    return null
+  }
+}
+
+const getCachedUser = (cacheKey: string): User | null => {
+  const cached = userCache.get(cacheKey)
+  if (!cached) {
+    return null
+  }
+
+  if (Date.now() >= cached.expiresAt) {
+    userCache.delete(cacheKey)
+    return null
+  }
+
+  // Each request gets its own copy so one context cannot mutate another's user
+  return structuredClone(cached.user)
+}
+
+const cacheUser = (cacheKey: string, user: User, token: string): void => {
+  // Tokens without a readable exp are never cached; others live until min(TTL, exp)
+  const tokenExpiry = getTokenExpiry(token)
+  const now = Date.now()
+  if (tokenExpiry === null || tokenExpiry <= now) {
+    return
+  }
+
+  if (userCache.size >= USER_CACHE_MAX_ENTRIES) {
+    const oldestKey = userCache.keys().next().value
+    if (oldestKey !== undefined) {
+      userCache.delete(oldestKey)
+    }
+  }
+
+  userCache.set(cacheKey, {
+    user: structuredClone(user),
+    expiresAt: Math.min(now + USER_CACHE_TTL_MS, tokenExpiry),
+  })
+}
+
+/**
+ * Resolve the Supabase user for a bearer token, reusing a recent lookup when the token is still valid
+ */
+export const resolveUser = async (supabase: Pick<SupabaseClient, 'auth'>, token: string): Promise<User | null> => {
+  const cacheKey = await getTokenCacheKey(token)
+  const cachedUser = getCachedUser(cacheKey)
+  if (cachedUser) {
+    return cachedUser
+  }
+
+  const {
+    data: { user },
+  } = await supabase.auth.getUser(token)
+
+  // Only successful lookups are cached so a rejected token is re-checked next time
+  if (user) {
+    cacheUser(cacheKey, user, token)
+  }
+
+  return user
+}
@@ -1,5 +1,6 @@
 import type { SupabaseClient } from '@supabase/supabase-js'
 import type { Database } from '@neonpro/database'
+import { runInBackground } from './background-tasks'
 
 export type AuditLogInsert = Database['public']['Tables']['audit_logs']['Insert']
 
@@ -14,6 +15,24 @@ export interface LogAuditEventOptions {
   createdAt?: AuditLogInsert['created_at']
 }
 
+// Upper bound on unacknowledged background writes; past it new events are dropped instead of growing memory
+const AUDIT_MAX_IN_FLIGHT = 1000
+let inFlightAuditWrites = 0
+let droppedAuditEvents = 0
+
+export interface AuditLogMetrics {
+  inFlight: number
+  dropped: number
+}
+
+/**
+ * Counters for alerting on audit backpressure
+ */
+export const getAuditLogMetrics = (): AuditLogMetrics => ({
+  inFlight: inFlightAuditWrites,
+  dropped: droppedAuditEvents,
+})
+
 export const logAuditEvent = async ({
   supabase,
   clinicId,
@@ -40,3 +59,32 @@ export const logAuditEvent = async ({
     console.error('Failed to write audit log:', error)
   }
 }
+
+/**
+ * Write an audit row without holding the response.
+ * The insert still runs under the caller's client, so RLS applies as before.
+ * Returns false when the event was dropped because too many writes are in flight.
+ */
+export const logAuditEventInBackground = (options: LogAuditEventOptions): boolean => {
+  if (inFlightAuditWrites >= AUDIT_MAX_IN_FLIGHT) {
+    droppedAuditEvents += 1
+    // Structured so log-based alerts can match on the event name
+    console.warn(JSON.stringify({
+      event: 'audit_log_dropped',
+      reason: 'in_flight_limit',
+      inFlight: inFlightAuditWrites,
+      droppedTotal: droppedAuditEvents,
+      clinicId: options.clinicId,
+      action: options.action,
+      resourceType: options.resourceType,
+    }))
+    return false
+  }
+
+  inFlightAuditWrites += 1
+  runInBackground('audit log write', logAuditEvent(options).finally(() => {
+    inFlightAuditWrites -= 1
+  }))
+
+  return true
+}
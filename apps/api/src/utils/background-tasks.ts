@@ -0,0 +1,53 @@
+/**
+ * Background task tracking
+ *
+ * Runs writes that should not hold the response. On Vercel each task is handed
+ * to the request context's waitUntil, so the function stays alive until the
+ * task settles instead of being frozen mid-write.
+ */
+
+// Same lookup @vercel/functions uses for waitUntil; absent outside Vercel
+const VERCEL_REQUEST_CONTEXT = Symbol.for('@vercel/request-context')
+
+interface RequestContextWithWaitUntil {
+  waitUntil?: (promise: Promise<unknown>) => void
+}
+
+interface RequestContextAccessor {
+  get?: () => RequestContextWithWaitUntil | undefined
+}
+
+const pendingTasks = new Set<Promise<void>>()
+
+const getWaitUntil = (): RequestContextWithWaitUntil['waitUntil'] => {
+  const accessor = (globalThis as Record<symbol, RequestContextAccessor | undefined>)[VERCEL_REQUEST_CONTEXT]
+  return accessor?.get?.()?.waitUntil
+}
+
+/**
+ * Track a task without awaiting it; failures are logged, never thrown to the caller
+ */
+export const runInBackground = (label: string, task: Promise<unknown>): Promise<void> => {
+  const tracked: Promise<void> = task
+    .then(
+      () => undefined,
+      (error) => {
+        console.error(`Background task failed (${label}):`, error)
+      },
+    )
+    .finally(() => {
+      pendingTasks.delete(tracked)
+    })
+
+  pendingTasks.add(tracked)
+  getWaitUntil()?.(tracked)
+
+  return tracked
+}
+
+/**
+ * Wait for every task started so far (shutdown hooks and tests)
+ */
+export const drainBackgroundTasks = async (): Promise<void> => {
+  await Promise.all(pendingTasks)
+}